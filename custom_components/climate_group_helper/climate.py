@@ -772,7 +772,7 @@ class ClimateGroup(GroupEntity, ClimateEntity, RestoreEntity):
 
         # Set startup time if all members are ready
         if not self.startup_time and all_members_ready:
-            self.startup_time = time.time()
+            self.startup_time = time.monotonic()
             self.hass.async_create_task(self.schedule_handler.schedule_listener(caller="group"))
             self._device_calibration("temperature", force=True)
             self._device_calibration("humidity", force=True)
@@ -6,6 +6,7 @@ import asyncio
 import logging
 import time
 from abc import ABC
+from contextvars import ContextVar
 from typing import TYPE_CHECKING, Any, Callable
 
 from homeassistant.components.climate import (
@@ -19,7 +20,7 @@ from homeassistant.components.climate import (
     HVACMode,
 )
 from homeassistant.const import ATTR_ENTITY_ID, STATE_UNAVAILABLE, STATE_UNKNOWN
-from homeassistant.core import Context, State
+from homeassistant.core import Context, State, callback
 from homeassistant.helpers.debounce import Debouncer
 
 from .const import (
@@ -36,6 +37,9 @@ if TYPE_CHECKING:
 
 _LOGGER = logging.getLogger(__name__)
 
+# Targets of the window control call running in the current task
+_WINDOW_TARGET_ENTITY_IDS: ContextVar[list[str] | None] = ContextVar("window_target_entity_ids", default=None)
+
 
 class BaseServiceCallHandler(ABC):
     """Base class for service call execution with debouncing and retry logic.
@@ -108,6 +112,19 @@ class BaseServiceCallHandler(ABC):
         Stale calls that slip through a blocking `async_call` are caught by
         `_is_stale_call` inside `_execute_calls`.
         """
+        await self._prepare_debouncer(data).async_call()
+
+    @callback
+    def schedule_debounced(self, data: dict[str, Any] | None = None) -> None:
+        """Schedule a debounced service call from a callback without awaiting it.
+
+        Same semantics as `call_debounced`, but usable from synchronous event
+        loop code without wrapping the call in a task first.
+        """
+        self._prepare_debouncer(data).async_schedule_call()
+
+    def _prepare_debouncer(self, data: dict[str, Any] | None = None) -> Debouncer:
+        """Cancel superseded work and point the debouncer at the new data."""
         # Cancel any running retry task — its stale data must not be sent.
         for task in list(self._active_tasks):
             task.cancel()
@@ -137,7 +154,7 @@ class BaseServiceCallHandler(ABC):
             self._debouncer.async_cancel()
             self._debouncer.function = debounce_func
 
-        await self._debouncer.async_call()
+        return self._debouncer
 
     async def _execute_calls(self, data: dict[str, Any] | None = None) -> None:
         """Execute service calls with retry logic."""
@@ -545,25 +562,32 @@ class WindowControlCallHandler(BaseServiceCallHandler):
     def __init__(self, group: ClimateGroup):
         """Initialize the window control call handler."""
         super().__init__(group)
-        self._target_entity_ids: list[str] | None = None
 
     async def call_immediate(self, data: dict[str, Any] | None = None, entity_ids: list[str] | None = None) -> None:
         """Execute a service call immediately, optionally targeting specific entities.
         
+        The targets are task-local, so overlapping area calls (one area turning
+        off while another restores) each keep their own batched entity list.
+
         Args:
             data: Optional data dict with attributes to set
             entity_ids: Optional list of entity IDs to target (for area-based control)
         """
-        self._target_entity_ids = entity_ids
+        token = _WINDOW_TARGET_ENTITY_IDS.set(entity_ids)
         try:
             await self._execute_calls(data)
         finally:
-            self._target_entity_ids = None
+            _WINDOW_TARGET_ENTITY_IDS.reset(token)
+
+    @callback
+    def schedule_immediate(self, data: dict[str, Any] | None = None, entity_ids: list[str] | None = None) -> None:
+        """Schedule an immediate service call from a callback without awaiting it."""
+        self._hass.async_create_task(self.call_immediate(data, entity_ids))
 
     def _get_call_entity_ids(self, attr: str, value: Any = None) -> list[str]:  # noqa: ARG002
         """Return target entity IDs if set, otherwise all members."""
-        if self._target_entity_ids is not None:
-            return self._target_entity_ids
+        if (entity_ids := _WINDOW_TARGET_ENTITY_IDS.get()) is not None:
+            return entity_ids
         return self._group.climate_entity_ids
 
 
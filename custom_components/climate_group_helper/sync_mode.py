@@ -2,10 +2,9 @@
 
 from __future__ import annotations
 
-import asyncio
 import logging
 import time
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Final
 
 from homeassistant.components.climate import HVACMode
 
@@ -23,6 +22,21 @@ if TYPE_CHECKING:
 
 _LOGGER = logging.getLogger(__name__)
 
+_HVAC_OFF = HVACMode.OFF
+_SENTINEL = object()
+
+# (event_type, domain) of the service calls issued by our own call handlers
+_CLIMATE_SERVICE_EVENT = ("call_service", "climate")
+
+# Context IDs of the call handlers whose service calls count as our own echoes
+_TRUSTED_CONTEXT_IDS: Final = frozenset({"service_call", "group", "sync_mode", "schedule"})
+
+# Context IDs whose member changes are never adopted nor enforced against
+_SUPPRESSED_CONTEXT_IDS: Final = frozenset({"window_control"})
+
+# Setpoints are meaningless while the group is OFF (frost protection values)
+_SETPOINT_ATTRS = frozenset({"temperature", "target_temp_low", "target_temp_high", "humidity"})
+
 
 class SyncModeHandler:
     """Synchronizes group state with members using Lock or Mirror mode.
@@ -49,7 +63,14 @@ class SyncModeHandler:
             self._group.sync_mode,
             self._filter_state,
         )
-        self._active_sync_tasks: set[asyncio.Task] = set()
+        self._allowed_keys = frozenset(key for key, allowed in self._filter_state.to_dict().items() if allowed)
+        # Syncing every attribute ("sync everything") makes the filter a no-op
+        self._filter_is_identity = self._allowed_keys >= frozenset(SYNC_TARGET_ATTRS)
+        self._mode_handlers = {
+            SyncMode.MIRROR: self._handle_mirror,
+            SyncMode.LOCK: self._handle_lock,
+            SyncMode.MASTER_LOCK: self._handle_master_lock,
+        }
 
     @property
     def state_manager(self):
@@ -75,13 +96,13 @@ class SyncModeHandler:
         # Block during startup to prevent initial state flood from overwriting target_state.
         if (
             self._group.startup_time
-            and (time.time() - self._group.startup_time) < STARTUP_BLOCK_DELAY
+            and (time.monotonic() - self._group.startup_time) < STARTUP_BLOCK_DELAY
         ):
             _LOGGER.debug("[%s] Startup phase, sync blocked", self._group.entity_id)
             return
 
-        event = self._group.event
-        origin_event = getattr(event.context, "origin_event", None)
+        ctx = self._group.event.context
+        origin_event = getattr(ctx, "origin_event", None) if ctx else None
         change_entity_id = self._group.change_state.entity_id or None
         change_dict = self._group.change_state.attributes()
 
@@ -89,63 +110,88 @@ class SyncModeHandler:
             return
 
         # Suppress echoes from window_control context
-        if event.context.id == "window_control":
-            _LOGGER.debug("[%s] Ignoring window_control echo", self._group.entity_id)
+        if ctx and ctx.id in _SUPPRESSED_CONTEXT_IDS:
+            _LOGGER.debug("[%s] Ignoring %s echo", self._group.entity_id, ctx.id)
             return
 
+        state_manager = self.state_manager
+
         # Deep Origin Analysis: Did we cause this change?
         if self._is_own_echo(origin_event):
-            accepted = self._filter_echo_changes(origin_event, change_dict, change_entity_id)
+            accepted = self._analyze_echo(
+                change_dict,
+                origin_event.data.get("service_data", {}),
+                self._extract_origin_entity(origin_event),
+                change_entity_id,
+                self._group.entity_id,
+            )
             if accepted:
                 _LOGGER.debug("[%s] Adopting side effects: %s", self._group.entity_id, accepted)
-                self.state_manager.update(entity_id=change_entity_id, **accepted)
+                state_manager.update(entity_id=change_entity_id, **accepted)
             return
 
         # --- Fresh Event (external change) ---
         _LOGGER.debug("[%s] External change: %s from %s", self._group.entity_id, change_dict, change_entity_id)
 
         # Filter out setpoint values when HVAC is OFF (meaningless frost protection values)
-        is_switching_on = "hvac_mode" in change_dict and change_dict["hvac_mode"] != HVACMode.OFF
-        if self.target_state.hvac_mode == HVACMode.OFF and not is_switching_on:
-            setpoint_attrs = {"temperature", "target_temp_low", "target_temp_high", "humidity"}
-            change_dict = {key: value for key, value in change_dict.items() if key not in setpoint_attrs}
+        # unless this change switches the group back on.
+        if (
+            state_manager.target_state.hvac_mode == _HVAC_OFF
+            and change_dict.get("hvac_mode", _HVAC_OFF) == _HVAC_OFF
+        ):
+            change_dict = {key: value for key, value in change_dict.items() if key not in _SETPOINT_ATTRS}
             if not change_dict:
                 _LOGGER.debug("[%s] Ignoring setpoint changes while OFF", self._group.entity_id)
                 return
 
-        # Mirror mode: adopt filtered changes into target_state
-        if self._group.sync_mode == SyncMode.MIRROR:
-            if filtered := {key: value for key, value in change_dict.items() if self._filter_state.to_dict().get(key)}:
-                self.state_manager.update(entity_id=change_entity_id, **filtered)
-                _LOGGER.debug("[%s] TargetState updated: %s", self._group.entity_id, self.target_state)
-
-        # Lock mode: only accept "Last Man Standing" OFF (Partial Sync)
-        elif (
-            self._group.sync_mode == SyncMode.LOCK
-            and self._group.config.get(CONF_IGNORE_OFF_MEMBERS)
-            and change_dict.get("hvac_mode") == HVACMode.OFF
-        ):
-            if self.state_manager.update(entity_id=change_entity_id, hvac_mode=HVACMode.OFF):
-                _LOGGER.debug("[%s] Last Man Standing: accepted OFF from %s", self._group.entity_id, change_entity_id)
-
-        # Master/Lock mode: master adopts (MIRROR), non-master reverts (LOCK)
-        elif self._group.sync_mode == SyncMode.MASTER_LOCK:
-            master_id = self._group._master_entity_id
-            if master_id and change_entity_id == master_id:
-                if filtered := {key: value for key, value in change_dict.items() if self._filter_state.to_dict().get(key)}:
-                    self.state_manager.update(entity_id=change_entity_id, **filtered)
-                    _LOGGER.debug("[%s] Master entity change adopted: %s", self._group.entity_id, filtered)
-            # Non-master changes are enforced (reverted) via call_debounced below
+        # Mode-specific adoption (STANDARD never reaches this point)
+        if handler := self._mode_handlers.get(self._group.sync_mode):
+            handler(change_dict, change_entity_id)
 
         # Enforce target state on all members (skip during blocking mode)
-        if not self._group.blocking_mode:
-            sync_task = self._hass.async_create_background_task(
-                self.call_handler.call_debounced(), name="climate_group_sync_enforcement"
-            )
-            self._active_sync_tasks.add(sync_task)
-            sync_task.add_done_callback(self._active_sync_tasks.discard)
-        else:
+        if self._group.blocking_mode:
             _LOGGER.debug("[%s] Enforcement skipped (blocking mode)", self._group.entity_id)
+            return
+
+        self.call_handler.schedule_debounced()
+
+    # --- Sync Mode Handlers ---
+
+    def _handle_mirror(self, change_dict: dict, change_entity_id: str | None) -> None:
+        """Mirror mode: adopt filtered changes into target_state."""
+        if filtered := self._filter_sync_attrs(change_dict):
+            self.state_manager.update(entity_id=change_entity_id, **filtered)
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug("[%s] TargetState updated: %s", self._group.entity_id, self.target_state)
+
+    def _handle_lock(self, change_dict: dict, change_entity_id: str | None) -> None:
+        """Lock mode: only accept "Last Man Standing" OFF (Partial Sync)."""
+        if not self._group.config.get(CONF_IGNORE_OFF_MEMBERS) or change_dict.get("hvac_mode") != _HVAC_OFF:
+            return
+        if self.state_manager.update(entity_id=change_entity_id, hvac_mode=_HVAC_OFF):
+            _LOGGER.debug("[%s] Last Man Standing: accepted OFF from %s", self._group.entity_id, change_entity_id)
+
+    def _handle_master_lock(self, change_dict: dict, change_entity_id: str | None) -> None:
+        """Master/Lock mode: master adopts (MIRROR), non-master reverts (LOCK).
+
+        Non-master changes are enforced (reverted) by the enforcement step in resync.
+        """
+        master_id = self._group._master_entity_id
+        if not master_id or change_entity_id != master_id:
+            return
+        if filtered := self._filter_sync_attrs(change_dict):
+            self.state_manager.update(entity_id=change_entity_id, **filtered)
+            _LOGGER.debug("[%s] Master entity change adopted: %s", self._group.entity_id, filtered)
+
+    def _filter_sync_attrs(self, change_dict: dict) -> dict:
+        """Return the changes restricted to the configured sync attributes."""
+        if self._filter_is_identity:
+            return change_dict
+        # Fast path: most member updates carry a single attribute
+        if len(change_dict) == 1:
+            attr = next(iter(change_dict))
+            return change_dict if attr in self._allowed_keys else {}
+        return {key: value for key, value in change_dict.items() if key in self._allowed_keys}
 
     # --- Echo Detection Helpers ---
 
@@ -153,45 +199,45 @@ class SyncModeHandler:
         """Check if the state change was caused by one of our own service calls."""
         if not origin_event:
             return False
-        if origin_event.event_type != "call_service" or origin_event.data.get("domain") != "climate":
+        if (origin_event.event_type, origin_event.data.get("domain")) != _CLIMATE_SERVICE_EVENT:
             return False
-        trusted_ids = {"service_call", "group", "sync_mode", "schedule"}
-        return origin_event.context.id in trusted_ids
+        return origin_event.context.id in _TRUSTED_CONTEXT_IDS
 
     @staticmethod
     def _extract_origin_entity(origin_event) -> str:
         """Extract origin entity from parent_id (format: 'entity_id|timestamp')."""
         parent_id = origin_event.context.parent_id or ""
-        if "|" in parent_id:
-            try:
-                origin, _ = parent_id.split("|", 1)
-                return origin
-            except ValueError:
-                pass
-        return ""
+        origin, sep, _ = parent_id.partition("|")
+        return origin if sep else ""
 
-    def _filter_echo_changes(self, origin_event, change_dict: dict, change_entity_id: str | None) -> dict:
-        """Filter echo changes, returning only accepted side effects.
+    @staticmethod
+    def _analyze_echo(
+        change_dict: dict,
+        service_data: dict,
+        origin: str,
+        change_entity_id: str | None,
+        group_id: str,
+    ) -> dict:
+        """Analyze an echo of our own service call, returning only accepted side effects.
 
         - Ordered attrs that match: Clean Echo -> ignored (already in sync)
         - Ordered attrs that differ: Dirty Echo -> ignored ("Order Wins")
         - Unordered attrs (side effects): Accepted only from origin entity ("Sender Wins")
         """
-        service_data = origin_event.data.get("service_data", {})
-        origin = self._extract_origin_entity(origin_event)
+        debug = _LOGGER.isEnabledFor(logging.DEBUG)
         accepted = {}
 
         for attr, new_value in change_dict.items():
-            if attr not in service_data:
+            ordered_value = service_data.get(attr, _SENTINEL)
+            if ordered_value is _SENTINEL:
                 # Side effect: only accept from origin entity ("Sender Wins")
                 if origin and change_entity_id != origin:
-                    _LOGGER.debug("[%s] Side effect rejected: %s != origin %s", self._group.entity_id, change_entity_id, origin)
+                    if debug:
+                        _LOGGER.debug("[%s] Side effect rejected: %s != origin %s", group_id, change_entity_id, origin)
                     continue
                 accepted[attr] = new_value
-            else:
+            elif ordered_value != new_value and debug:
                 # Ordered attr: ignore if value doesn't match ("Order Wins" / Dirty Echo)
-                if service_data[attr] != new_value:
-                    _LOGGER.debug("[%s] Dirty echo ignored: %s=%s (ordered %s)", self._group.entity_id, attr, new_value, service_data[attr])
+                _LOGGER.debug("[%s] Dirty echo ignored: %s=%s (ordered %s)", group_id, attr, new_value, ordered_value)
 
         return accepted
-
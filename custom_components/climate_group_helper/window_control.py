@@ -14,7 +14,7 @@ Key Changes from base version:
 6. Integrated with architecture (call_handler, target_state)
 
 Architecture Integration:
-- Uses self.call_handler.call_immediate(entity_ids=...) for targeted control
+- Uses self.call_handler.schedule_immediate(entity_ids=...) for targeted control
 - Respects self.target_state for restoration
 - Compatible with state management system
 
@@ -29,13 +29,19 @@ from __future__ import annotations
 
 import logging
 import time
+from collections.abc import Sequence
 from typing import TYPE_CHECKING, Any
 
 from homeassistant.components.climate import HVACMode
 from homeassistant.const import STATE_ON, STATE_OPEN, STATE_UNAVAILABLE, STATE_UNKNOWN
-from homeassistant.core import Event, EventStateChangedData, callback
-from homeassistant.helpers.event import async_call_later, async_track_state_change_event
+from homeassistant.core import CALLBACK_TYPE, Event, EventStateChangedData, HassJob, callback
+from homeassistant.helpers.event import (
+    async_call_later,
+    async_track_entity_registry_updated_event,
+    async_track_state_change_event,
+)
 from homeassistant.helpers import entity_registry as er, device_registry as dr
+from homeassistant.helpers.debounce import Debouncer
 
 from .const import (
     CONF_CLOSE_DELAY,
@@ -64,6 +70,16 @@ _LOGGER = logging.getLogger(__name__)
 # Constants
 WINDOW_CLOSE = "close"
 WINDOW_OPEN = "open"
+AREA_INDEX_REBUILD_DELAY = 1.0
+
+_OPEN_STATES: frozenset[str] = frozenset((STATE_ON, STATE_OPEN))
+_UNAVAILABLE_STATES: frozenset[str] = frozenset((STATE_UNAVAILABLE, STATE_UNKNOWN))
+_MISSING = object()
+_HVAC_OFF = HVACMode.OFF
+
+
+def _noop() -> None:
+    """Stand-in cancel callback for windows without a pending timer."""
 
 
 class WindowControlHandler:
@@ -73,13 +89,18 @@ class WindowControlHandler:
         """Initialize the window control handler."""
         self._group = group
         self._hass = group.hass
+        self._states_get = group.hass.states.get
         self._timer_cancel: Any = None
+        self._pending_mode: str | None = None
+        self._timer_job = HassJob(self._timer_expired, "window_control_timer", cancel_on_shutdown=True)
         self._unsub_listener = None
 
         self._window_control_mode = self._group.config.get(CONF_WINDOW_MODE, WindowControlMode.OFF)
         self._window_action = self._group.config.get(CONF_WINDOW_ACTION, WindowControlAction.OFF)
         self._window_temperature = self._group.config.get(CONF_WINDOW_TEMPERATURE)
         self._control_state = WINDOW_CLOSE
+        # Polled via blocking_mode on every group update; only the legacy mode ever sets it
+        self.force_off = False
 
         # Configuration
         self._room_sensor = group.config.get(CONF_ROOM_SENSOR)
@@ -93,13 +114,27 @@ class WindowControlHandler:
         self._window_open_delay = group.config.get(CONF_WINDOW_OPEN_DELAY, DEFAULT_WINDOW_OPEN_DELAY)
 
         # Area-based state tracking
-        self._timers: dict[str, Any] = {}
-
-        # Legacy state tracking
-        self._room_open = False
-        self._zone_open = False
-        self._room_last_changed = None
-        self._zone_last_changed = None
+        self._open_timers: dict[str, CALLBACK_TYPE] = {}
+        self._close_timers: dict[str, CALLBACK_TYPE] = {}
+        # Open window -> loop time it opened at
+        self._open_windows: dict[str, float] = {}
+        self._pending_off_areas: set[str] = set()
+        self._drain_scheduled = False
+
+        # Area routing tables (rebuilt on entity/device registry updates)
+        self._entity_area_cache: dict[str, str | None] = {}
+        self._device_area_cache: dict[str, str | None] = {}
+        self._device_entities: dict[str, set[str]] = {}
+        self._ent_reg: er.EntityRegistry | None = None
+        self._dev_reg: dr.DeviceRegistry | None = None
+        self._window_area: dict[str, str | None] = {}
+        self._area_to_windows: dict[str, frozenset[str]] = {}
+        self._area_to_thermostats: dict[str, tuple[str, ...]] = {}
+        self._unsub_registry: list[CALLBACK_TYPE] = []
+        self._index_debouncer = Debouncer(
+            self._hass, _LOGGER, cooldown=AREA_INDEX_REBUILD_DELAY, immediate=False,
+            function=self._build_area_index,
+        )
 
         _LOGGER.debug(
             "[%s] WindowControl initialized. (room: %s.open_delay: %ds), (zone: %s.open_delay: %ds), (room/zone: close_delay: %ds)",
@@ -120,17 +155,22 @@ class WindowControlHandler:
         """Return the current target state (from central source)."""
         return self.state_manager.target_state
 
-    @property
-    def force_off(self) -> bool:
-        """Return whether window control is active."""
-        return self._control_state == WINDOW_OPEN
-
     def async_teardown(self) -> None:
         """Unsubscribe from sensors and cancel timers."""
         self._cancel_timer()
         if self._unsub_listener:
             self._unsub_listener()
             self._unsub_listener = None
+        while self._unsub_registry:
+            self._unsub_registry.pop()()
+        self._index_debouncer.async_cancel()
+
+        # Area timers are plain loop timers: nothing cancels them on shutdown for us
+        for timers in (self._open_timers, self._close_timers):
+            for cancel in timers.values():
+                cancel()
+            timers.clear()
+        self._pending_off_areas.clear()
 
     async def async_setup(self) -> None:
         """Subscribe to window sensor state changes."""
@@ -150,6 +190,25 @@ class WindowControlHandler:
                 self._hass, self._window_sensors, self._area_based_listener
             )
             _LOGGER.debug("[%s] Area-based window control subscribed to: %s", self._group.entity_id, self._window_sensors)
+
+            # Area assignments only change through the registries
+            self._ent_reg = er.async_get(self._hass)
+            self._dev_reg = dr.async_get(self._hass)
+            self._unsub_registry.append(async_track_entity_registry_updated_event(
+                self._hass, [*self._window_sensors, *self._group.climate_entity_ids], self._entity_registry_updated
+            ))
+            self._unsub_registry.append(self._hass.bus.async_listen(
+                dr.EVENT_DEVICE_REGISTRY_UPDATED, self._device_registry_updated
+            ))
+            self._build_area_index()
+
+            # Seed the open windows; the listener keeps them current from here on
+            loop_offset = self._hass.loop.time() - time.time()
+            self._open_windows = {
+                window_id: state.last_changed_timestamp + loop_offset
+                for window_id in self._window_sensors
+                if (state := self._states_get(window_id)) and state.state in _OPEN_STATES
+            }
             return
 
         # Legacy mode
@@ -173,21 +232,29 @@ class WindowControlHandler:
         if result:
             mode, delay = result
             if mode == WINDOW_OPEN:
-                self._control_state = WINDOW_OPEN
+                self._set_control_state(WINDOW_OPEN)
             if delay <= 0:
-                self._hass.async_create_task(self._execute_action(mode))
+                self._execute_action(mode)
             else:
-                self._timer_cancel = async_call_later(self._hass, delay, self._timer_expired)
+                self._pending_mode = mode
+                self._timer_cancel = async_call_later(self._hass, delay, self._timer_job)
 
     @callback
     def _state_change_listener(self, event: Event[EventStateChangedData]) -> None:
         """Handle sensor event – recalculate and schedule action."""
+        # Attribute-only updates and transitions that keep the open/closed
+        # outcome (e.g. off -> unavailable) must not restart the pending delay
+        old_state = event.data.get("old_state")
+        new_state = event.data.get("new_state")
+        if old_state and new_state and (old_state.state in _OPEN_STATES) == (new_state.state in _OPEN_STATES):
+            return
+
         _LOGGER.debug("[%s] Sensor event: %s", self._group.entity_id, event.data.get("entity_id"))
 
         result = self._window_control_logic()
         if result is None:
             _LOGGER.debug("[%s] Window control sensors not available", self._group.entity_id)
-            self._control_state = WINDOW_CLOSE
+            self._set_control_state(WINDOW_CLOSE)
             return
 
         mode, delay = result
@@ -200,49 +267,60 @@ class WindowControlHandler:
 
         if delay > 0:
             _LOGGER.debug("[%s] Scheduling action in %.1fs", self._group.entity_id, delay)
-            self._timer_cancel = async_call_later(self._hass, delay, self._timer_expired)
+            self._pending_mode = mode
+            self._timer_cancel = async_call_later(self._hass, delay, self._timer_job)
         else:
-            self._hass.async_create_task(self._execute_action(mode))
+            self._execute_action(mode)
 
     @callback
     def _timer_expired(self, now: Any) -> None:
         """Timer callback – recalculate and execute current action."""
         self._timer_cancel = None
-        mode, _ = self._window_control_logic()
+        # Sensor changes cancel the timer, so the mode computed when scheduling still holds
+        mode, self._pending_mode = self._pending_mode, None
+        if mode is None and (result := self._window_control_logic()):
+            mode, _ = result
         if mode:
-            self._hass.async_create_task(self._execute_action(mode))
+            self._execute_action(mode)
 
     def _cancel_timer(self) -> None:
         """Cancel any pending timer."""
+        self._pending_mode = None
         if self._timer_cancel:
             self._timer_cancel()
             self._timer_cancel = None
             _LOGGER.debug("[%s] Timer cancelled", self._group.entity_id)
 
-    async def _execute_action(self, mode: str) -> None:
+    def _set_control_state(self, mode: str) -> None:
+        """Set the legacy control state and the derived force_off flag."""
+        self._control_state = mode
+        self.force_off = mode == WINDOW_OPEN
+
+    @callback
+    def _execute_action(self, mode: str) -> None:
         """Execute heating ON/OFF action.
         
         Window Control does NOT modify target_state:
-        - OPEN: Forces members OFF via call_immediate
-        - CLOSE: Restores members to target_state via call_immediate
+        - OPEN: Forces members OFF via schedule_immediate
+        - CLOSE: Restores members to target_state via schedule_immediate
         """
         # Update control state first
-        self._control_state = mode
+        self._set_control_state(mode)
 
         if mode == WINDOW_OPEN:
             if self._window_action == WindowControlAction.TEMPERATURE and self._window_temperature is not None:
                 _LOGGER.debug("[%s] Window opened, setting temperature to %.1f", self._group.entity_id, self._window_temperature)
-                await self.call_handler.call_immediate({"temperature": self._window_temperature})
-            elif self._group.hvac_mode != HVACMode.OFF:
+                self.call_handler.schedule_immediate({"temperature": self._window_temperature})
+            elif self._group.hvac_mode != _HVAC_OFF:
                 _LOGGER.debug("[%s] Window opened, turning HVAC OFF", self._group.entity_id)
-                await self.call_handler.call_immediate({"hvac_mode": HVACMode.OFF})
+                self.call_handler.schedule_immediate({"hvac_mode": _HVAC_OFF})
             else:
                 _LOGGER.debug("[%s] Window opened, HVAC already OFF in target_state", self._group.entity_id)
 
         elif mode == WINDOW_CLOSE:
             # Restore target_state via self.call_handler
             _LOGGER.debug("[%s] Window closed, restoring target_state", self._group.entity_id)
-            await self.call_handler.call_immediate()
+            self.call_handler.schedule_immediate()
 
     def _window_control_logic(self) -> tuple[str, float] | None:
         """This method implements the core logic for window control.
@@ -250,47 +328,38 @@ class WindowControlHandler:
         Return the control mode and the timer delay.
         Return None if no sensors are configured.
         """
-        self._room_open = None
-        self._zone_open = None
-        self._room_last_changed = None
-        self._zone_last_changed = None
-
         # If no sensors are configured, return None
         if not self._room_sensor and not self._zone_sensor:
             return None
 
-        # If no room sensor is configured, room is always closed
-        if self._room_sensor and (state := self._hass.states.get(self._room_sensor)):
-            self._room_open = state.state in (STATE_ON, STATE_OPEN)
-            self._room_last_changed = time.time() - state.last_changed.timestamp()
-        else:
-            self._room_open = False
-            self._room_last_changed = float("inf")
-
-        # If no zone sensor is configured, use room sensor state
-        if self._zone_sensor and (state := self._hass.states.get(self._zone_sensor)):
-            self._zone_open = state.state in (STATE_ON, STATE_OPEN) or self._room_open
-            self._zone_last_changed = time.time() - state.last_changed.timestamp()
+        now = time.time()
+        room_state = self._states_get(self._room_sensor) if self._room_sensor else None
+        zone_state = self._states_get(self._zone_sensor) if self._zone_sensor else None
+
+        # If no room sensor is configured, room is always closed; if no zone
+        # sensor is configured, the zone follows the room sensor
+        room_open = room_state is not None and room_state.state in _OPEN_STATES
+        zone_open = room_open or (zone_state is not None and zone_state.state in _OPEN_STATES)
+        zone_ref = zone_state or room_state
+        zone_elapsed = now - zone_ref.last_changed_timestamp if zone_ref else None
+
+        if room_open:
+            # Room open: whichever of the room and zone delays runs out first
+            mode = WINDOW_OPEN
+            delay = min(
+                max(self._room_delay - (now - room_state.last_changed_timestamp), 0),
+                max(self._zone_delay - zone_elapsed, 0),
+            )
+        elif zone_open:
+            mode = WINDOW_OPEN
+            delay = max(self._zone_delay - zone_elapsed, 0)
         else:
-            self._zone_open = self._room_open
-            self._zone_last_changed = self._room_last_changed
-
-        # Calculate timers
-        timer_room_open = max(self._room_delay - self._room_last_changed, 0) if self._room_open else self._room_delay
-        timer_zone_open = max(self._zone_delay - self._zone_last_changed, 0) if self._zone_open else self._zone_delay
-        timer_zone_close = max(self._close_delay - self._zone_last_changed, 0) if not self._zone_open else self._close_delay
-
-        # Calculate delays
-        delay_room_open = min(timer_room_open, timer_zone_open) if self._room_open else None
-        delay_zone_open = timer_zone_open if self._zone_open and not self._room_open else None
-        delay_zone_close = timer_zone_close if not self._zone_open or not self._room_open else None
-
-        # Calculate mode and delay
-        mode = WINDOW_OPEN if self._zone_open or self._room_open else WINDOW_CLOSE
-        delay = (delay_room_open or delay_zone_open or delay_zone_close) or 0
+            # Without any sensor state the windows have been closed "forever"
+            mode = WINDOW_CLOSE
+            delay = max(self._close_delay - zone_elapsed, 0) if zone_elapsed is not None else 0
 
         _LOGGER.debug("[%s] Window control: mode=%s, delay=%.1fs (room_open=%s, zone_open=%s)",
-            self._group.entity_id, mode, delay, self._room_open, self._zone_open)
+            self._group.entity_id, mode, delay, room_open, zone_open)
 
         return mode, delay
 
@@ -299,136 +368,232 @@ class WindowControlHandler:
     @callback
     def _area_based_listener(self, event: Event[EventStateChangedData]) -> None:
         """Handle window sensor state changes in area-based mode."""
-        window_id = event.data.get("entity_id")
-        if not window_id:
+        # The tracker dispatches by entity_id, so the event payload is always complete
+        data = event.data
+        window_id = data["entity_id"]
+        new_state = data["new_state"]
+        new_value = new_state.state if new_state else None
+        if new_value is None or new_value in _UNAVAILABLE_STATES:
+            self._open_windows.pop(window_id, None)
             return
-        
-        new_state = event.data.get("new_state")
-        if not new_state or new_state.state in (STATE_UNAVAILABLE, STATE_UNKNOWN):
+
+        # Attribute-only updates (battery, signal strength) and transitions that keep
+        # the open/closed outcome (on -> open) are filtered before any set access.
+        # A sensor coming back from unavailable always re-evaluates its area.
+        old_state = data["old_state"]
+        is_open = new_value in _OPEN_STATES
+        if old_state is None:
+            if (window_id in self._open_windows) == is_open:
+                return
+        elif old_state.state not in _UNAVAILABLE_STATES and (old_state.state in _OPEN_STATES) == is_open:
             return
 
-        is_open = new_state.state in (STATE_ON, STATE_OPEN)
-        
-        if window_id in self._timers:
-            self._timers[window_id]()
-            del self._timers[window_id]
-        
+        area_id = self._window_area.get(window_id)
         if is_open:
-            delay = self._window_open_delay
-            _LOGGER.debug("[%s] Window %s opened, scheduling turn off in %ss", 
-                         self._group.entity_id, window_id, delay)
-            
-            self._timers[window_id] = async_call_later(
-                self._hass, delay,
-                lambda _: self._hass.loop.call_soon_threadsafe(
-                    self._hass.async_create_task, self._handle_window_opened(window_id)
-                )
-            )
+            self._open_windows[window_id] = self._hass.loop.time()
         else:
-            delay = self._close_delay
-            _LOGGER.debug("[%s] Window %s closed, scheduling restore check in %ss", 
-                         self._group.entity_id, window_id, delay)
-            
-            self._timers[window_id] = async_call_later(
-                self._hass, delay,
-                lambda _: self._hass.loop.call_soon_threadsafe(
-                    self._hass.async_create_task, self._handle_window_closed(window_id)
-                )
-            )
-
-    async def _handle_window_opened(self, window_id: str) -> None:
-        """Handle window opening after delay."""
-        state = self._hass.states.get(window_id)
-        if not state or state.state not in (STATE_ON, STATE_OPEN):
-            _LOGGER.debug("[%s] Window %s no longer open, skipping", self._group.entity_id, window_id)
+            self._open_windows.pop(window_id, None)
+        if not area_id:
+            # Already warned about when the area index was built
+            _LOGGER.debug("[%s] Ignoring window %s without area", self._group.entity_id, window_id)
             return
-            
-        window_area = self._get_entity_area(window_id)
-        if not window_area:
-            _LOGGER.warning("[%s] Cannot determine area for window %s", self._group.entity_id, window_id)
+
+        if is_open:
+            # A pending restore is moot; an armed open timer already covers this window
+            self._close_timers.pop(area_id, _noop)()
+            if area_id in self._open_timers:
+                return
+            _LOGGER.debug("[%s] Window %s opened, scheduling turn off of area '%s' in %ss",
+                         self._group.entity_id, window_id, area_id, self._window_open_delay)
+            self._schedule_area_timer(area_id, True, self._window_open_delay)
             return
 
-        thermostats_to_turn_off = self._get_thermostats_in_area(window_area, only_active=True)
-        
-        if not thermostats_to_turn_off:
-            _LOGGER.debug("[%s] No active thermostats in area '%s'", self._group.entity_id, window_area)
+        # Restore only once every window in the area is closed
+        if not self._open_windows.keys().isdisjoint(self._area_to_windows.get(area_id, frozenset())):
+            _LOGGER.debug("[%s] Window %s closed but other windows still open in area '%s'",
+                         self._group.entity_id, window_id, area_id)
             return
 
-        _LOGGER.info("[%s] Window %s opened in area '%s', turning off: %s", 
-                    self._group.entity_id, window_id, window_area, thermostats_to_turn_off)
-        
-        await self.call_handler.call_immediate({"hvac_mode": HVACMode.OFF}, entity_ids=thermostats_to_turn_off)
+        self._open_timers.pop(area_id, _noop)()
+        _LOGGER.debug("[%s] Window %s closed, scheduling restore check of area '%s' in %ss",
+                     self._group.entity_id, window_id, area_id, self._close_delay)
+        self._schedule_area_timer(area_id, False, self._close_delay)
 
-    async def _handle_window_closed(self, window_id: str) -> None:
-        """Handle window closing after delay."""
-        state = self._hass.states.get(window_id)
-        if not state or state.state in (STATE_ON, STATE_OPEN):
-            _LOGGER.debug("[%s] Window %s no longer closed, skipping", self._group.entity_id, window_id)
+    def _schedule_area_timer(self, area_id: str, opened: bool, delay: float) -> None:
+        """Arm the open or close timer of an area, replacing a pending one."""
+        # Plain loop timer: no HassJob/UTC datetime layer, these delays are short and local
+        timers = self._open_timers if opened else self._close_timers
+        timers.pop(area_id, _noop)()
+        timers[area_id] = self._hass.loop.call_later(delay, self._fire, area_id, opened).cancel
+
+    @callback
+    def _fire(self, area_id: str, opened: bool) -> None:
+        """Area delay expired – dispatch the area shutdown or restore check."""
+        # Loop timers lack HassJob's cancel_on_shutdown: never switch members while stopping
+        if self._hass.is_stopping:
             return
-            
-        window_area = self._get_entity_area(window_id)
-        if not window_area:
+        if opened:
+            del self._open_timers[area_id]
+            self._handle_window_opened(area_id)
+        else:
+            del self._close_timers[area_id]
+            self._handle_window_closed(area_id)
+
+    @callback
+    def _handle_window_opened(self, area_id: str) -> None:
+        """Handle windows of an area opening after delay."""
+        # The timer was armed by the first window to open; the open delay must
+        # have elapsed for at least one window that is still open.
+        open_windows = self._open_windows
+        deadline = self._hass.loop.time() - self._window_open_delay
+        remaining = min(
+            (
+                opened_at - deadline
+                for window_id in self._area_to_windows.get(area_id, ())
+                if (opened_at := open_windows.get(window_id)) is not None
+            ),
+            default=None,
+        )
+        if remaining is None:
+            _LOGGER.debug("[%s] No windows open in area '%s' anymore, skipping", self._group.entity_id, area_id)
+            return
+        if remaining > 0:
+            self._schedule_area_timer(area_id, True, remaining)
             return
 
-        # Check if any other windows in same area are still open
-        for other_window_id in self._window_sensors:
-            if other_window_id == window_id:
-                continue
-            
-            if self._get_entity_area(other_window_id) == window_area:
-                state = self._hass.states.get(other_window_id)
-                if state and state.state in (STATE_ON, STATE_OPEN):
-                    _LOGGER.debug("[%s] Window %s closed but other windows still open in area '%s'", 
-                                 self._group.entity_id, window_id, window_area)
-                    return
-
-        thermostats_to_restore = []
-        for member_id in self._get_thermostats_in_area(window_area):
-            state = self._hass.states.get(member_id)
-            if state and state.state == HVACMode.OFF:
-                thermostats_to_restore.append(member_id)
-        
-        if not thermostats_to_restore:
-            _LOGGER.debug("[%s] No thermostats to restore in area '%s'", self._group.entity_id, window_area)
+        _LOGGER.debug("[%s] Windows opened in area '%s'", self._group.entity_id, area_id)
+
+        # Coalesce areas opening in the same loop iteration into one service call
+        self._pending_off_areas.add(area_id)
+        if not self._drain_scheduled:
+            self._drain_scheduled = True
+            self._hass.loop.call_soon(self._drain_pending_off)
+
+    @callback
+    def _drain_pending_off(self) -> None:
+        """Turn off the active thermostats of all areas with newly opened windows."""
+        self._drain_scheduled = False
+        areas = self._pending_off_areas
+        self._pending_off_areas = set()
+
+        thermostats_to_turn_off: list[str] = []
+        for area_id in areas:
+            thermostats_to_turn_off.extend(self._get_thermostats_in_area(area_id, only_active=True))
+
+        if not thermostats_to_turn_off:
+            _LOGGER.debug("[%s] No active thermostats in areas %s", self._group.entity_id, areas)
             return
 
-        if self.target_state.hvac_mode == HVACMode.OFF:
+        _LOGGER.info("[%s] Windows opened in areas %s, turning off: %s",
+                    self._group.entity_id, areas, thermostats_to_turn_off)
+
+        self.call_handler.schedule_immediate({"hvac_mode": _HVAC_OFF}, entity_ids=thermostats_to_turn_off)
+
+    @callback
+    def _handle_window_closed(self, area_id: str) -> None:
+        """Handle all windows of an area being closed after delay."""
+        # Nothing to restore towards: skip the member state lookups entirely
+        if self.target_state.hvac_mode == _HVAC_OFF:
             _LOGGER.debug("[%s] Target mode is OFF, not restoring", self._group.entity_id)
             return
 
-        _LOGGER.info("[%s] Window %s closed, restoring area '%s': %s", 
-                    self._group.entity_id, window_id, window_area, thermostats_to_restore)
+        thermostats_to_restore = [
+            member_id for member_id in self._get_thermostats_in_area(area_id)
+            if (state := self._states_get(member_id)) and state.state == _HVAC_OFF
+        ]
+
+        if not thermostats_to_restore:
+            _LOGGER.debug("[%s] No thermostats to restore in area '%s'", self._group.entity_id, area_id)
+            return
+
+        _LOGGER.info("[%s] Windows closed, restoring area '%s': %s",
+                    self._group.entity_id, area_id, thermostats_to_restore)
         
-        await self.call_handler.call_immediate(entity_ids=thermostats_to_restore)
+        self.call_handler.schedule_immediate(entity_ids=thermostats_to_restore)
 
-    def _get_thermostats_in_area(self, area_id: str, only_active: bool = False) -> list[str]:
-        """Get list of thermostats in the specified area."""
-        thermostats = []
-        for member_id in self._group.climate_entity_ids:
-            if self._get_entity_area(member_id) == area_id:
-                if only_active:
-                    state = self._hass.states.get(member_id)
-                    if state and state.state != HVACMode.OFF:
-                        thermostats.append(member_id)
-                else:
-                    thermostats.append(member_id)
-        return thermostats
+    def _get_thermostats_in_area(self, area_id: str, only_active: bool = False) -> Sequence[str]:
+        """Get the thermostats in the specified area."""
+        thermostats = self._area_to_thermostats.get(area_id, ())
+        if not only_active:
+            return thermostats
+
+        return [
+            member_id for member_id in thermostats
+            if (state := self._states_get(member_id)) and state.state != _HVAC_OFF
+        ]
 
     def _get_entity_area(self, entity_id: str) -> str | None:
-        """Get the area ID for an entity."""
-        ent_reg = er.async_get(self._hass)
-        entity_entry = ent_reg.async_get(entity_id)
-        
+        """Get the area ID for an entity (cached)."""
+        area_id = self._entity_area_cache.get(entity_id, _MISSING)
+        if area_id is _MISSING:
+            area_id = self._entity_area_cache[entity_id] = self._resolve_entity_area(entity_id)
+        return area_id
+
+    def _resolve_entity_area(self, entity_id: str) -> str | None:
+        """Resolve the area ID for an entity via the entity and device registries."""
+        entity_entry = self._ent_reg.async_get(entity_id)
         if not entity_entry:
             return None
-        
-        if entity_entry.area_id:
+
+        # An explicit entity area overrides the area inherited from its device
+        if entity_entry.area_id or not entity_entry.device_id:
             return entity_entry.area_id
-        
-        if entity_entry.device_id:
-            dev_reg = dr.async_get(self._hass)
-            device_entry = dev_reg.async_get(entity_entry.device_id)
-            if device_entry and device_entry.area_id:
-                return device_entry.area_id
-        
-        return None
\ No newline at end of file
+
+        # Devices often carry several tracked entities (e.g. a TRV with its window sensor)
+        device_id = entity_entry.device_id
+        self._device_entities.setdefault(device_id, set()).add(entity_id)
+        area_id = self._device_area_cache.get(device_id, _MISSING)
+        if area_id is _MISSING:
+            device_entry = self._dev_reg.async_get(device_id)
+            area_id = self._device_area_cache[device_id] = device_entry.area_id if device_entry else None
+        return area_id
+
+    @callback
+    def _build_area_index(self) -> None:
+        """Build the window -> area -> thermostats routing tables."""
+        window_area: dict[str, str | None] = {}
+        area_to_windows: dict[str, list[str]] = {}
+        for window_id in self._window_sensors:
+            area_id = window_area[window_id] = self._get_entity_area(window_id)
+            if area_id is None:
+                _LOGGER.warning("[%s] Cannot determine area for window %s", self._group.entity_id, window_id)
+            else:
+                area_to_windows.setdefault(area_id, []).append(window_id)
+
+        area_to_thermostats: dict[str, list[str]] = {}
+        for member_id in self._group.climate_entity_ids:
+            if (area_id := self._get_entity_area(member_id)) is not None:
+                area_to_thermostats.setdefault(area_id, []).append(member_id)
+
+        self._window_area = window_area
+        self._area_to_windows = {area_id: frozenset(windows) for area_id, windows in area_to_windows.items()}
+        self._area_to_thermostats = {area_id: tuple(members) for area_id, members in area_to_thermostats.items()}
+        _LOGGER.debug("[%s] Area index built: windows=%s, thermostats=%s",
+            self._group.entity_id, area_to_windows, area_to_thermostats)
+
+    @callback
+    def _entity_registry_updated(self, event: Event[er.EventEntityRegistryUpdatedData]) -> None:
+        """Rebuild the area index when a tracked entity moves or disappears."""
+        data = event.data
+        if data["action"] == "update" and not {"area_id", "device_id"} & data.get("changes", {}).keys():
+            return
+        # Only this entity's cached area is stale; everything else is reused by the rebuild
+        self._entity_area_cache.pop(data["entity_id"], None)
+        if old_entity_id := data.get("old_entity_id"):
+            self._entity_area_cache.pop(old_entity_id, None)
+        self._index_debouncer.async_schedule_call()
+
+    @callback
+    def _device_registry_updated(self, event: Event[dr.EventDeviceRegistryUpdatedData]) -> None:
+        """Rebuild the area index when a device changes area."""
+        data = event.data
+        if data["action"] == "update" and "area_id" not in data.get("changes", {}):
+            return
+        # Only devices our tracked entities inherit their area from matter
+        device_id = data["device_id"]
+        if (entities := self._device_entities.pop(device_id, None)) is None:
+            return
+        for entity_id in entities:
+            self._entity_area_cache.pop(entity_id, None)
+        self._device_area_cache.pop(device_id, None)
+        self._index_debouncer.async_schedule_call()